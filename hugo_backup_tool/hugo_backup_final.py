@@ -12,12 +12,20 @@ Hugo博客备份工具 - 最终版本
 
 import os
 import shutil
+import sqlite3
+import threading
 import re
 import hashlib
 import json
+import logging
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Any
-from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Set, Tuple, Any
+from dataclasses import asdict, dataclass
 
 @dataclass
 class ArticleInfo:
@@ -30,6 +38,15 @@ class ArticleInfo:
     day: int
     date_str: str
 
+@dataclass
+class MarkdownResult:
+    """单个markdown文件的处理结果"""
+    article: ArticleInfo
+    image_paths: Set[str]
+    digest: str
+    source_state: List[int]
+    updated: bool
+
 class ConfigManager:
     """配置管理器"""
     
@@ -63,10 +80,15 @@ class ConfigManager:
 class HugoBlogBackup:
     """Hugo博客备份主类"""
     
+    # 增量跳过时读取的文件开头字节数，足以覆盖frontmatter
+    HEAD_SIZE = 4096
+    
     def __init__(self, config_path: str = "config.json"):
         self.config = ConfigManager(config_path)
+        self._init_options()
         self._init_paths()
         self._init_filters()
+        self._init_regexes()
         
         # 存储文章信息和使用的图片
         self.articles = {}
@@ -75,11 +97,46 @@ class HugoBlogBackup:
         # 存储变更信息
         self.updated_files = []
         
+        # 上次运行记录的状态，用于增量判断：
+        # 图片源文件的(size, mtime_ns)，处理后markdown内容的摘要，
+        # 以及markdown源文件的(size, mtime_ns, 使用的图片)
+        self.manifest_path = self.backup_root / '.backup.db'
+        self._config_digest = self.get_content_digest(json.dumps(self.config.config, sort_keys=True))
+        manifest = self._load_manifest()
+        self._manifest: Dict[str, List[int]] = manifest.get('files', {})
+        self._content_manifest: Dict[str, str] = manifest.get('contents', {})
+        self._source_manifest: Dict[str, list] = manifest.get('sources', {})
+        self._readme_digest: str = manifest.get('meta', {}).get('readme', '')
+        # 加载时的快照，保存时只写入有变化的记录
+        self._manifest_snapshot = {key: dict(value) for key, value in manifest.items()}
+        # 本次运行实际处理过的路径，未出现的旧记录在保存时删除
+        self._seen_paths: Set[str] = set()
+        
         # 初始化文章分类
-        categories = self.config.get('readme.categories', {})
-        for category in categories.keys():
+        for category in self.categories_config.keys():
             self.articles[category] = []
     
+    def _init_options(self):
+        """缓存热路径上频繁使用的配置项，避免每次按点号路径查找"""
+        self._verbose = bool(self.config.get('logging.verbose', True))
+        self._init_logger()
+        self._show_stats = bool(self.config.get('logging.show_stats', True))
+        self._date_format = self.config.get('readme.date_format', 'YYYY-MM-DD')
+        self.categories_config = self.config.get('readme.categories', {})
+    
+    def _init_logger(self):
+        """初始化日志，非verbose模式下只输出警告和错误
+
+        使用%风格的参数延迟格式化，被过滤掉的日志不会构造字符串。
+        """
+        self._log = logging.getLogger('hugo_backup')
+        self._log.setLevel(logging.INFO if self._verbose else logging.WARNING)
+        if not self._log.handlers:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            self._log.addHandler(handler)
+            self._log.propagate = False
+    
     def _init_paths(self):
         """初始化路径配置"""
         self.source_root = Path(self.config.get('paths.source_root')).expanduser().resolve()
@@ -100,11 +157,179 @@ class HugoBlogBackup:
         """初始化过滤器配置"""
         self.ignore_files = set(self.config.get('filters.ignore_files', []))
         self.markdown_extensions = set(self.config.get('filters.markdown_extensions', ['.md']))
+        self._markdown_suffixes = tuple(ext.lower() for ext in self.markdown_extensions)
+        self.path_patterns = tuple(self.config.get('images.path_patterns', []))
+        # 长前缀优先匹配，避免被较短的前缀截断
+        self._path_patterns_desc = tuple(sorted(self.path_patterns, key=len, reverse=True))
+        
+        # 并发处理的线程数，任务以文件IO为主
+        self.max_workers = min(32, (os.cpu_count() or 1) * 4)
+    
+    def _init_regexes(self):
+        """预编译正则表达式，避免每个文件重复编译"""
+        self._re_frontmatter = re.compile(r'\A---\s*\n(?P<fm>.*?)\n---\s*\n', re.DOTALL)
+        self._re_title = re.compile(r'title:\s*["\']?(.*?)["\']?\s*$', re.MULTILINE)
+        self._re_img = re.compile(r'!\[.*?\]\(([^)]+)\)')
+        self._re_date = re.compile(r'^(\d{4})(\d{2})(\d{2})_')
+        
+        # 路径修正流水线，每个文件只需依次调用，无需再读取配置
+        self._fix_pipeline: List[Callable[[str], str]] = []
+        
+        # 图片路径修正
+        img_corrections = self.config.get('path_corrections.images', {})
+        from_patterns = img_corrections.get('from_patterns', [])
+        to_pattern = img_corrections.get('to_pattern', '')
+        if from_patterns:
+            # 所有来源前缀合并为一个分支，一次扫描完成替换；长前缀优先
+            alternation = '|'.join(map(re.escape, sorted(from_patterns, key=len, reverse=True)))
+            img_re = re.compile(rf'!\[([^\]]*)\]\((?:{alternation})([^)]+)\)')
+            self._fix_pipeline.append(self._guarded_fix(
+                tuple(f'({pattern}' for pattern in from_patterns),
+                partial(img_re.sub, rf'![\1]({to_pattern}\2)')
+            ))
+        
+        # 文章引用路径修正，同时处理 /old_dir/xxx 与只有目录的 /old_dir 两种引用
+        article_corrections = self.config.get('path_corrections.articles', {})
+        self._article_map = {old_dir: new_dir.rstrip('/') for old_dir, new_dir in article_corrections.items()}
+        if article_corrections:
+            alternation = '|'.join(map(re.escape, sorted(article_corrections, key=len, reverse=True)))
+            article_re = re.compile(rf'\[([^\]]+)\]\(/(?P<dir>{alternation})(?P<rest>(?:/[^)]*)?)\)')
+            self._fix_pipeline.append(self._guarded_fix(
+                tuple(f'](/{old_dir}' for old_dir in article_corrections),
+                partial(article_re.sub, self._replace_article_path)
+            ))
+    
+    @staticmethod
+    def _guarded_fix(needles: Tuple[str, ...], fix: Callable[[str], str]) -> Callable[[str], str]:
+        """先用子串查找预检，内容中不含任何旧路径时跳过正则替换"""
+        def guarded(content: str) -> str:
+            if any(needle in content for needle in needles):
+                return fix(content)
+            return content
+        return guarded
+    
+    def _connect_manifest(self) -> sqlite3.Connection:
+        """打开文件状态数据库，必要时建表"""
+        db = sqlite3.connect(self.manifest_path)
+        db.executescript("""
+            CREATE TABLE IF NOT EXISTS files(path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER);
+            CREATE TABLE IF NOT EXISTS contents(path TEXT PRIMARY KEY, digest TEXT);
+            CREATE TABLE IF NOT EXISTS sources(path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, images TEXT);
+            CREATE TABLE IF NOT EXISTS meta(key TEXT PRIMARY KEY, value TEXT);
+        """)
+        return db
+    
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """加载上次运行的文件状态清单"""
+        if not self.manifest_path.exists():
+            return {}
+        
+        try:
+            with closing(self._connect_manifest()) as db:
+                meta = dict(db.execute('SELECT key, value FROM meta'))
+                manifest = {
+                    'meta': meta,
+                    'files': {path: [size, mtime] for path, size, mtime in db.execute('SELECT path, size, mtime FROM files')},
+                    'contents': dict(db.execute('SELECT path, digest FROM contents')),
+                    'sources': {},
+                }
+                # 配置变化(如路径修正规则)会影响处理结果，此时不能仅凭源文件状态跳过
+                if meta.get('config') == self._config_digest:
+                    manifest['sources'] = {
+                        path: [size, mtime, json.loads(images)]
+                        for path, size, mtime, images in db.execute('SELECT path, size, mtime, images FROM sources')
+                    }
+                return manifest
+        except (sqlite3.Error, ValueError) as e:
+            self._log.warning("⚠️  读取文件清单失败: %s", e)
+            return {}
+    
+    def _save_manifest(self):
+        """保存文件状态清单，只写入本次有变化的记录，并删除本次未处理路径的记录"""
+        def changed(section: str, current: Dict[str, Any]) -> List[Tuple[str, Any]]:
+            previous = self._manifest_snapshot.get(section, {})
+            return [(key, value) for key, value in current.items() if previous.get(key) != value]
+        
+        meta = {'config': self._config_digest, 'readme': self._readme_digest}
+        try:
+            with closing(self._connect_manifest()) as db, db:
+                # 配置变化后旧的源文件记录全部失效，只保留本次重新生成的
+                if self._manifest_snapshot.get('meta', {}).get('config') != self._config_digest:
+                    db.execute('DELETE FROM sources')
+                
+                for table in ('files', 'contents', 'sources'):
+                    stale = [(path,) for path in self._manifest_snapshot.get(table, {}) if path not in self._seen_paths]
+                    db.executemany(f'DELETE FROM {table} WHERE path = ?', stale)
+                
+                db.executemany(
+                    'INSERT OR REPLACE INTO files VALUES (?, ?, ?)',
+                    [(path, size, mtime) for path, (size, mtime) in changed('files', self._manifest)]
+                )
+                db.executemany(
+                    'INSERT OR REPLACE INTO contents VALUES (?, ?)',
+                    changed('contents', self._content_manifest)
+                )
+                db.executemany(
+                    'INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?)',
+                    [(path, size, mtime, json.dumps(images, ensure_ascii=False))
+                     for path, (size, mtime, images) in changed('sources', self._source_manifest)]
+                )
+                db.executemany('INSERT OR REPLACE INTO meta VALUES (?, ?)', changed('meta', meta))
+        except sqlite3.Error as e:
+            self._log.warning("⚠️  保存文件清单失败: %s", e)
+    
+    def _manifest_key(self, target_file: Path) -> str:
+        """清单中使用相对于备份根目录的路径作为键"""
+        return target_file.relative_to(self.backup_root).as_posix()
+    
+    def _record_manifest(self, source_file: Path, target_file: Path):
+        """记录源文件状态，下次运行时stat一致即可跳过比较"""
+        stat = source_file.stat()
+        target_key = self._manifest_key(target_file)
+        self._manifest[target_key] = [stat.st_size, stat.st_mtime_ns]
+        self._seen_paths.add(target_key)
     
-    def log(self, message: str):
-        """日志输出"""
-        if self.config.get('logging.verbose', True):
-            print(message)
+    def _decode_md(self, data: bytes, errors: str = 'strict') -> str:
+        """解码markdown内容，与read_text一致，统一换行符为\\n"""
+        return data.decode('utf-8', errors).replace('\r\n', '\n').replace('\r', '\n')
+    
+    def _read_head(self, file_path: Path) -> str:
+        """只读取文件开头部分，用于提取frontmatter"""
+        with open(file_path, 'rb') as f:
+            return self._decode_md(f.read(self.HEAD_SIZE), 'replace')
+    
+    def _read_md(self, file_path: Path) -> str:
+        """一次性读取markdown文件
+
+        提示内核顺序预读，读完后释放页缓存，避免一次性读取的文件污染缓存。
+        """
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except (AttributeError, OSError):
+                pass
+            
+            size = os.fstat(fd).st_size
+            chunks = []
+            while True:
+                chunk = os.read(fd, max(size, 1 << 16))
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            except (AttributeError, OSError):
+                pass
+        finally:
+            os.close(fd)
+        
+        return self._decode_md(b''.join(chunks))
+    
+    def get_content_digest(self, content: str) -> str:
+        """计算处理后内容的摘要"""
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
     
     def should_ignore_file(self, filename: str) -> bool:
         """检查文件是否应该被忽略"""
@@ -112,52 +337,92 @@ class HugoBlogBackup:
     
     def is_markdown_file(self, filename: str) -> bool:
         """检查是否为markdown文件"""
-        return any(filename.lower().endswith(ext) for ext in self.markdown_extensions)
+        return filename.lower().endswith(self._markdown_suffixes)
+    
+    def _walk_files(self, root: Path, skip_hidden: bool = True) -> Iterator[os.DirEntry]:
+        """递归遍历目录下的文件，可选跳过隐藏目录(.git等)
+
+        使用os.scandir，普通文件的类型判断直接复用readdir结果，无需额外stat。
+        与rglob一致：指向文件的符号链接会被返回，但不进入符号链接目录。
+        """
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not (skip_hidden and entry.name.startswith('.')):
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
     
     def get_file_hash(self, file_path: Path) -> str:
-        """计算文件的MD5哈希值"""
+        """计算文件的BLAKE2b哈希值，分块读取避免大文件占用内存"""
         try:
             with open(file_path, 'rb') as f:
-                return hashlib.md5(f.read()).hexdigest()
+                if hasattr(hashlib, 'file_digest'):
+                    return hashlib.file_digest(f, 'blake2b').hexdigest()
+                
+                # Python 3.11 以下没有 hashlib.file_digest
+                h = hashlib.blake2b()
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    h.update(chunk)
+                return h.hexdigest()
         except Exception:
             return ""
     
     def file_needs_update(self, source_file: Path, target_file: Path) -> bool:
         """检查文件是否需要更新"""
-        if not target_file.exists():
+        try:
+            source_stat = source_file.stat()
+            target_stat = target_file.stat()
+        except FileNotFoundError:
             return True
         
-        source_hash = self.get_file_hash(source_file)
-        target_hash = self.get_file_hash(target_file)
+        # 大小不同必然需要更新
+        if source_stat.st_size != target_stat.st_size:
+            return True
         
-        return source_hash != target_hash
+        # 源文件状态与上次记录一致，无需读取内容
+        if self._manifest.get(self._manifest_key(target_file)) == [source_stat.st_size, source_stat.st_mtime_ns]:
+            return False
+        
+        # 状态无法判断时逐块比较，遇到差异立即返回
+        chunk_size = 1 << 20
+        with open(source_file, 'rb') as fs, open(target_file, 'rb') as ft:
+            while True:
+                source_chunk = fs.read(chunk_size)
+                target_chunk = ft.read(chunk_size)
+                if source_chunk != target_chunk:
+                    return True
+                if not source_chunk:
+                    return False
+    
+    def _split_frontmatter(self, content: str) -> Tuple[str, str]:
+        """一次匹配同时得到标题和去除frontmatter后的正文"""
+        match = self._re_frontmatter.match(content)
+        if not match:
+            return "未知标题", content
+        
+        title_match = self._re_title.search(match.group('fm'))
+        title = title_match.group(1).strip() if title_match else "未知标题"
+        return title, content[match.end():]
     
     def extract_frontmatter_title(self, content: str) -> str:
         """从frontmatter中提取标题"""
-        frontmatter_pattern = r'^---\s*\n(.*?)\n---\s*\n'
-        match = re.search(frontmatter_pattern, content, re.DOTALL)
-        
-        if match:
-            frontmatter = match.group(1)
-            title_match = re.search(r'title:\s*["\']?(.*?)["\']?\s*$', frontmatter, re.MULTILINE)
-            if title_match:
-                return title_match.group(1).strip()
-        
-        return "未知标题"
+        title, _ = self._split_frontmatter(content)
+        return title
     
     def extract_image_paths(self, content: str) -> Set[str]:
         """从markdown内容中提取图片路径"""
         image_paths = set()
-        img_pattern = r'!\[.*?\]\(([^)]+)\)'
-        matches = re.findall(img_pattern, content)
-        
-        path_patterns = self.config.get('images.path_patterns', [])
-        
-        for match in matches:
+        for match in self._re_img.findall(content):
             # 移除可能的锚点标记
-            clean_path = match.split('#')[0]
+            clean_path = match.partition('#')[0]
+            if not clean_path.startswith(self.path_patterns):
+                continue
             
-            for pattern in path_patterns:
+            for pattern in self._path_patterns_desc:
                 if clean_path.startswith(pattern):
                     relative_path = clean_path[len(pattern):]
                     image_paths.add(relative_path)
@@ -167,49 +432,20 @@ class HugoBlogBackup:
     
     def fix_paths_in_content(self, content: str) -> str:
         """修正内容中的路径"""
-        # 修正图片路径
-        img_corrections = self.config.get('path_corrections.images', {})
-        from_patterns = img_corrections.get('from_patterns', [])
-        to_pattern = img_corrections.get('to_pattern', '')
-        
-        for pattern in from_patterns:
-            escaped_pattern = re.escape(pattern)
-            content = re.sub(
-                rf'!\[([^\]]*)\]\({escaped_pattern}([^)]+)\)',
-                rf'![\1]({to_pattern}\2)',
-                content
-            )
-        
-        # 修正文章引用路径
-        article_corrections = self.config.get('path_corrections.articles', {})
-        for old_dir, new_dir in article_corrections.items():
-            old_pattern = f'/{old_dir}/'
-            escaped_old = re.escape(old_pattern)
-            content = re.sub(
-                rf'\[([^\]]+)\]\({escaped_old}([^)]*)?(\))',
-                rf'[\1]({new_dir}\2\3)',
-                content
-            )
-            
-            # 处理只有目录的引用
-            old_pattern_simple = f'/{old_dir}'
-            escaped_old_simple = re.escape(old_pattern_simple)
-            content = re.sub(
-                rf'\[([^\]]+)\]\({escaped_old_simple}(/[^)]*)?(\))',
-                rf'[\1]({new_dir.rstrip("/")}\2\3)',
-                content
-            )
-        
+        for fix in self._fix_pipeline:
+            content = fix(content)
         return content
     
+    def _replace_article_path(self, match: re.Match) -> str:
+        """文章引用路径的替换回调"""
+        new_dir = self._article_map[match.group('dir')]
+        return f"[{match.group(1)}]({new_dir}{match.group('rest')})"
+    
     def process_markdown_content(self, content: str) -> Tuple[str, str, Set[str]]:
         """处理markdown内容"""
-        title = self.extract_frontmatter_title(content)
-        image_paths = self.extract_image_paths(content)
-        
-        # 移除frontmatter
-        frontmatter_pattern = r'^---\s*\n.*?\n---\s*\n'
-        content_without_frontmatter = re.sub(frontmatter_pattern, '', content, flags=re.DOTALL)
+        # 提取标题并移除frontmatter
+        title, content_without_frontmatter = self._split_frontmatter(content)
+        image_paths = self.extract_image_paths(content_without_frontmatter)
         
         # 修正路径
         content_with_fixed_paths = self.fix_paths_in_content(content_without_frontmatter)
@@ -221,11 +457,10 @@ class HugoBlogBackup:
     
     def extract_date_from_filename(self, filename: str) -> Tuple[int, int, int, str]:
         """从文件名中提取日期信息"""
-        date_match = re.match(r'^(\d{4})(\d{2})(\d{2})_', filename)
+        date_match = self._re_date.match(filename)
         if date_match:
             year, month, day = date_match.groups()
-            date_format = self.config.get('readme.date_format', 'YYYY-MM-DD')
-            if date_format == 'YYYY-MM-DD':
+            if self._date_format == 'YYYY-MM-DD':
                 date_str = f"{year}-{month}-{day}"
             else:
                 date_str = f"{year}年{int(month)}月{int(day)}日"
@@ -237,81 +472,193 @@ class HugoBlogBackup:
         for dir_path in self.target_dirs.values():
             dir_path.mkdir(parents=True, exist_ok=True)
     
+    def _process_one_md(self, file_path: Path, source_dir: Path, target_dir: Path) -> MarkdownResult:
+        """处理单个markdown文件
+
+        该方法会在线程池中并发执行，不修改任何共享状态。
+        """
+        # 计算目标文件路径
+        rel_path = file_path.relative_to(source_dir)
+        target_file = target_dir / rel_path
+        target_file.parent.mkdir(parents=True, exist_ok=True)
+        target_key = self._manifest_key(target_file)
+        
+        stat = file_path.stat()
+        source_state = [stat.st_size, stat.st_mtime_ns]
+        recorded_source = self._source_manifest.get(target_key)
+        recorded_digest = self._content_manifest.get(target_key)
+        
+        year, month, day, date_str = self.extract_date_from_filename(file_path.name)
+        
+        def make_article(title: str) -> ArticleInfo:
+            return ArticleInfo(
+                title=title,
+                filename=file_path.name,
+                path=str(target_file.relative_to(self.backup_root)),
+                year=year,
+                month=month,
+                day=day,
+                date_str=date_str
+            )
+        
+        # 源文件状态与上次一致：只读取开头提取标题，图片列表沿用上次记录
+        if (recorded_source and recorded_source[:2] == source_state
+                and recorded_digest and target_file.exists()):
+            head = self._read_head(file_path)
+            match = self._re_frontmatter.match(head)
+            # frontmatter不完整地落在开头部分时，退回到完整处理
+            if match or stat.st_size <= self.HEAD_SIZE:
+                title, _ = self._split_frontmatter(head)
+                return MarkdownResult(
+                    article=make_article(title),
+                    image_paths=set(recorded_source[2]),
+                    digest=recorded_digest,
+                    source_state=source_state,
+                    updated=False
+                )
+        
+        # 读取文件内容用于处理和信息提取
+        content = self._read_md(file_path)
+        processed_content, title, image_paths = self.process_markdown_content(content)
+        result = MarkdownResult(
+            article=make_article(title),
+            image_paths=image_paths,
+            digest=self.get_content_digest(processed_content),
+            source_state=source_state,
+            updated=False
+        )
+        
+        # 检查是否需要更新（比较处理后内容的摘要，无需读取目标文件）
+        if target_file.exists():
+            if recorded_digest == result.digest:
+                return result
+            
+            # 清单中没有记录时退回到直接比较内容
+            if recorded_digest is None:
+                try:
+                    if target_file.read_text(encoding='utf-8') == processed_content:
+                        return result
+                except Exception:
+                    pass
+        
+        # 写入文件
+        self._write_target(target_file, processed_content)
+        result.updated = True
+        
+        return result
+    
+    def _write_target(self, target_file: Path, content: str):
+        """原子写入目标文件
+
+        先写入同目录下的私有临时文件，再用os.replace替换目标，
+        中途失败不会留下写了一半的文件。临时文件按0o666创建，由umask决定最终权限。
+        """
+        tmp = target_file.with_name(f'.{target_file.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content.encode('utf-8'))
+            os.replace(tmp, target_file)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+    
     def process_markdown_files(self, category: str):
         """处理指定类别的markdown文件"""
         source_dir = self.source_dirs.get(category)
         target_dir = self.target_dirs.get(category)
         
         if not source_dir or not source_dir.exists():
-            self.log(f"⚠️  源目录不存在: {source_dir}")
+            self._log.warning("⚠️  源目录不存在: %s", source_dir)
             return
         
-        self.log(f"📝 处理 {category} 文件...")
+        self._log.info("📝 处理 %s 文件...", category)
         
         processed_count = 0
         skipped_count = 0
         ignored_count = 0
         
-        for file_path in source_dir.rglob('*'):
-            if not file_path.is_file() or not self.is_markdown_file(file_path.name):
+        files = []
+        for entry in self._walk_files(source_dir):
+            if not self.is_markdown_file(entry.name):
                 continue
             
-            if self.should_ignore_file(file_path.name):
-                self.log(f"  ⏭️  忽略文件: {file_path.name}")
+            if self.should_ignore_file(entry.name):
+                self._log.info("  ⏭️  忽略文件: %s", entry.name)
                 ignored_count += 1
                 continue
             
-            # 计算目标文件路径
-            rel_path = file_path.relative_to(source_dir)
-            target_file = target_dir / rel_path
-            target_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # 读取文件内容用于处理和信息提取
+            files.append(Path(entry.path))
+        
+        # 文件读写为IO密集型，使用线程池并发处理
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self._process_one_md, file_path, source_dir, target_dir)
+                for file_path in files
+            ]
+        
+        # 按提交顺序汇总结果，保证日志和文章顺序稳定
+        for file_path, future in zip(files, futures):
             try:
-                content = file_path.read_text(encoding='utf-8')
-                title = self.extract_frontmatter_title(content)
-                image_paths = self.extract_image_paths(content)
-                self.used_images.update(image_paths)
-                
-                year, month, day, date_str = self.extract_date_from_filename(file_path.name)
-                
-                article_info = ArticleInfo(
-                    title=title,
-                    filename=file_path.name,
-                    path=str(target_file.relative_to(self.backup_root)),
-                    year=year,
-                    month=month,
-                    day=day,
-                    date_str=date_str
-                )
-                self.articles[category].append(article_info)
-                
-                # 处理内容
-                processed_content, _, _ = self.process_markdown_content(content)
-                
-                # 检查是否需要更新（比较处理后的内容）
-                needs_update = True
-                if target_file.exists():
-                    try:
-                        existing_content = target_file.read_text(encoding='utf-8')
-                        needs_update = existing_content != processed_content
-                    except Exception:
-                        needs_update = True
-                
-                if not needs_update:
-                    self.log(f"  ↔️  跳过文件: {file_path.name} (无变化)")
-                    skipped_count += 1
-                else:
-                    # 写入文件
-                    target_file.write_text(processed_content, encoding='utf-8')
-                    self.log(f"  ✅ 更新文件: {file_path.name} -> {title}")
-                    self.updated_files.append(f"{category}/{file_path.name}")
-                    processed_count += 1
-                
+                result = future.result()
             except Exception as e:
-                self.log(f"  ❌ 处理文件失败 {file_path.name}: {e}")
+                self._log.error("  ❌ 处理文件失败 %s: %s", file_path.name, e)
+                continue
+            
+            target_key = self._manifest_key(target_dir / file_path.relative_to(source_dir))
+            self._seen_paths.add(target_key)
+            self._content_manifest[target_key] = result.digest
+            self._source_manifest[target_key] = result.source_state + [sorted(result.image_paths)]
+            self.articles[category].append(result.article)
+            self.used_images.update(result.image_paths)
+            
+            if not result.updated:
+                self._log.info("  ↔️  跳过文件: %s (无变化)", file_path.name)
+                skipped_count += 1
+            else:
+                self._log.info("  ✅ 更新文件: %s -> %s", file_path.name, result.article.title)
+                self.updated_files.append(f"{category}/{file_path.name}")
+                processed_count += 1
+        
+        self._log.info("  📊 %s: 更新 %s 个文件，跳过 %s 个文件，忽略 %s 个文件", category, processed_count, skipped_count, ignored_count)
+    
+    def _fast_copy(self, source_file: Path, target_file: Path):
+        """复制文件内容及元数据
+
+        Linux上优先使用copy_file_range在内核中完成复制(支持reflink的文件系统上几乎零开销)，
+        不支持或未能完整复制时退回到shutil.copyfile(macOS上为fcopyfile，Linux上为sendfile)。
+        """
+        copied_all = False
+        if hasattr(os, 'copy_file_range'):
+            try:
+                with open(source_file, 'rb') as fs, open(target_file, 'wb') as ft:
+                    size = os.fstat(fs.fileno()).st_size
+                    offset = 0
+                    while offset < size:
+                        copied = os.copy_file_range(fs.fileno(), ft.fileno(), size - offset)
+                        if copied == 0:
+                            break
+                        offset += copied
+                    copied_all = offset >= size
+            except OSError:
+                copied_all = False
+        
+        if not copied_all:
+            shutil.copyfile(source_file, target_file)
+        shutil.copystat(source_file, target_file)
+    
+    def _copy_one_image(self, source_file: Path, target_file: Path) -> bool:
+        """复制单张图片，返回是否实际发生了复制"""
+        target_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        if not self.file_needs_update(source_file, target_file):
+            return False
         
-        self.log(f"  📊 {category}: 更新 {processed_count} 个文件，跳过 {skipped_count} 个文件，忽略 {ignored_count} 个文件")
+        self._fast_copy(source_file, target_file)
+        return True
     
     def copy_used_images(self):
         """复制被使用的图片"""
@@ -319,7 +666,7 @@ class HugoBlogBackup:
         target_pics = self.target_dirs.get('pics')
         
         if not source_pics or not source_pics.exists():
-            self.log(f"⚠️  图片目录不存在: {source_pics}")
+            self._log.warning("⚠️  图片目录不存在: %s", source_pics)
             return
         
         target_pics.mkdir(parents=True, exist_ok=True)
@@ -327,65 +674,81 @@ class HugoBlogBackup:
         copied_count = 0
         skipped_count = 0
         
-        # 获取所有图片文件
-        all_images = set()
-        for file_path in source_pics.rglob('*'):
-            if file_path.is_file():
-                rel_path = str(file_path.relative_to(source_pics))
-                all_images.add(rel_path)
+        # 遍历一次图片目录，仅用于统计未使用的图片数量
+        total_count = sum(1 for _ in self._walk_files(source_pics, skip_hidden=False))
         
-        # 只处理被使用的图片
+        # 复制队列直接来自被引用的图片，由文件系统解析路径(符号链接、大小写不敏感等)
+        queue = []
         for image_path in self.used_images:
+            try:
+                inode = (source_pics / image_path).stat().st_ino
+            except OSError:
+                self._log.info("  ⏭️  引用的图片不存在: %s", image_path)
+                continue
+            queue.append((inode, image_path))
+        
+        # 按inode排序近似磁盘上的物理顺序，并逐个顺序复制，
+        # 使机械硬盘/NAS上的读取基本连续，减少随机寻道
+        queue.sort()
+        image_paths = [image_path for _, image_path in queue]
+        
+        for image_path in image_paths:
             source_file = source_pics / image_path
             target_file = target_pics / image_path
-            
-            if not source_file.exists():
-                continue
-            
-            target_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            if not self.file_needs_update(source_file, target_file):
-                skipped_count += 1
+            try:
+                copied = self._copy_one_image(source_file, target_file)
+            except Exception as e:
+                self._log.error("  ❌ 复制图片失败 %s: %s", image_path, e)
                 continue
             
-            try:
-                shutil.copy2(source_file, target_file)
+            self._record_manifest(source_file, target_file)
+            if copied:
                 self.updated_files.append(f"pics/{image_path}")
                 copied_count += 1
-            except Exception as e:
-                self.log(f"  ❌ 复制图片失败 {image_path}: {e}")
+            else:
+                skipped_count += 1
         
-        unused_count = len(all_images) - len(self.used_images)
-        self.log(f"🖼️  图片同步完成: 复制 {copied_count} 个，跳过 {skipped_count} 个，忽略未使用 {unused_count} 个")
-        self.log(f"   -> {target_pics}")
+        unused_count = max(total_count - len(image_paths), 0)
+        self._log.info("🖼️  图片同步完成: 复制 %s 个，跳过 %s 个，忽略未使用 %s 个", copied_count, skipped_count, unused_count)
+        self._log.info("   -> %s", target_pics)
     
     def generate_readme(self):
         """生成README文件"""
+        readme_path = self.backup_root / "README.md"
+        
+        # 文章列表及README配置均未变化时无需重新生成
+        readme_state = json.dumps([
+            self.config.get('readme', {}),
+            {category: [asdict(a) for a in articles] for category, articles in self.articles.items()},
+        ], sort_keys=True, ensure_ascii=False)
+        readme_digest = self.get_content_digest(readme_state)
+        if not self.updated_files and readme_digest == self._readme_digest and readme_path.exists():
+            self._log.info("↔️  README 无变化，跳过生成")
+            return
+        
         readme_title = self.config.get('readme.title', '博客文章备份')
-        categories_config = self.config.get('readme.categories', {})
+        categories_config = self.categories_config
         
-        readme_content = f"# {readme_title}\n\n"
+        parts: List[str] = [f"# {readme_title}\n\n"]
         
         # 按配置的顺序处理分类
         sorted_categories = sorted(categories_config.items(), key=lambda x: x[1].get('order', 999))
         
         for category_key, category_config in sorted_categories:
             category_name = category_config.get('name', category_key)
-            readme_content += f"# {category_name}\n\n"
+            parts.append(f"# {category_name}\n\n")
             
             articles = self.articles.get(category_key, [])
             if articles:
                 # 按年份分组
-                articles_by_year = {}
+                articles_by_year = defaultdict(list)
                 for article in articles:
                     if article.year > 0:
-                        if article.year not in articles_by_year:
-                            articles_by_year[article.year] = []
                         articles_by_year[article.year].append(article)
                 
                 # 按年份倒序
                 for year in sorted(articles_by_year.keys(), reverse=True):
-                    readme_content += f"## {year}\n\n"
+                    parts.append(f"## {year}\n\n")
                     
                     # 按日期倒序
                     year_articles = sorted(
@@ -396,62 +759,62 @@ class HugoBlogBackup:
                     
                     for article in year_articles:
                         if article.date_str:
-                            readme_content += f"* {article.date_str} [{article.title}]({article.path})\n"
+                            parts.append(f"* {article.date_str} [{article.title}]({article.path})\n")
                         else:
-                            readme_content += f"* [{article.title}]({article.path})\n"
+                            parts.append(f"* [{article.title}]({article.path})\n")
                     
-                    readme_content += "\n"
+                    parts.append("\n")
                 
                 # 处理没有日期的文章
                 no_date_articles = [a for a in articles if a.year == 0]
                 if no_date_articles:
-                    readme_content += "## 其他\n\n"
+                    parts.append("## 其他\n\n")
                     for article in no_date_articles:
-                        readme_content += f"* [{article.title}]({article.path})\n"
-                    readme_content += "\n"
+                        parts.append(f"* [{article.title}]({article.path})\n")
+                    parts.append("\n")
             else:
-                readme_content += "暂无内容\n\n"
+                parts.append("暂无内容\n\n")
         
         # 写入README文件
-        readme_path = self.backup_root / "README.md"
-        readme_path.write_text(readme_content, encoding='utf-8')
+        readme_path.write_text(''.join(parts), encoding='utf-8')
+        self._readme_digest = readme_digest
         
-        self.log(f"✅ README.md 已生成: {readme_path}")
+        self._log.info("✅ README.md 已生成: %s", readme_path)
     
     def show_statistics(self):
         """显示统计信息"""
-        if not self.config.get('logging.show_stats', True):
+        if not self._show_stats:
             return
         
         total_articles = sum(len(articles) for articles in self.articles.values())
         
-        self.log("📊 统计信息:")
+        self._log.info("📊 统计信息:")
         for category, articles in self.articles.items():
-            category_config = self.config.get(f'readme.categories.{category}', {})
+            category_config = self.categories_config.get(category, {})
             category_name = category_config.get('name', category)
-            self.log(f"  - {category_name}: {len(articles)} 篇")
+            self._log.info("  - %s: %s 篇", category_name, len(articles))
         
-        self.log(f"  - 总计: {total_articles} 篇")
-        self.log(f"  - 使用的图片: {len(self.used_images)} 个")
+        self._log.info("  - 总计: %s 篇", total_articles)
+        self._log.info("  - 使用的图片: %s 个", len(self.used_images))
         
         # 显示变更汇总
         if self.updated_files:
-            self.log(f"🔄 本次更新了 {len(self.updated_files)} 个文件:")
+            self._log.info("🔄 本次更新了 %s 个文件:", len(self.updated_files))
             for file_path in self.updated_files:
-                self.log(f"  - {file_path}")
+                self._log.info("  - %s", file_path)
         else:
-            self.log("✨ 本次运行无更新")
+            self._log.info("✨ 本次运行无更新")
     
     def backup(self):
         """执行完整的备份流程"""
-        self.log("🚀 开始Hugo博客备份...")
-        self.log(f"源路径: {self.source_root}")
-        self.log(f"备份路径: {self.backup_root}")
-        self.log("-" * 50)
+        self._log.info("🚀 开始Hugo博客备份...")
+        self._log.info("源路径: %s", self.source_root)
+        self._log.info("备份路径: %s", self.backup_root)
+        self._log.info("-" * 50)
         
         # 1. 创建目录结构
         self.ensure_target_dirs()
-        self.log("✅ 目录结构创建完成")
+        self._log.info("✅ 目录结构创建完成")
         
         # 2. 处理各类别的markdown文件
         for category in self.source_dirs.keys():
@@ -464,11 +827,14 @@ class HugoBlogBackup:
         # 4. 生成README
         self.generate_readme()
         
-        self.log("-" * 50)
-        self.log("🎉 备份完成!")
-        self.log(f"备份文件位置: {self.backup_root}")
+        # 5. 保存文件状态清单
+        self._save_manifest()
+        
+        self._log.info("-" * 50)
+        self._log.info("🎉 备份完成!")
+        self._log.info("备份文件位置: %s", self.backup_root)
         
-        # 5. 显示统计信息
+        # 6. 显示统计信息
         self.show_statistics()
 
 def main():